@@ -14,6 +14,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._compute_date_feature': ( 'core.html#timeseries._compute_date_feature',
                                                                                        'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._compute_date_features': ( 'core.html#timeseries._compute_date_features',
+                                                                                        'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._compute_transforms': ( 'core.html#timeseries._compute_transforms',
                                                                                      'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._date_feature_names': ( 'core.html#timeseries._date_feature_names',
@@ -25,6 +27,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._get_raw_predictions': ( 'core.html#timeseries._get_raw_predictions',
                                                                                       'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._join_dynamic': ('core.html#timeseries._join_dynamic', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._null_rows': ('core.html#timeseries._null_rows', 'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._pack_transforms': ( 'core.html#timeseries._pack_transforms',
+                                                                                  'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._predict_multi': ('core.html#timeseries._predict_multi', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._predict_recursive': ( 'core.html#timeseries._predict_recursive',
                                                                                     'mlforecast/core.py'),
@@ -32,6 +38,8 @@ d = { 'settings': { 'branch': 'main',
                                  'mlforecast.core.TimeSeries._transform': ('core.html#timeseries._transform', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._update_features': ( 'core.html#timeseries._update_features',
                                                                                   'mlforecast/core.py'),
+                                 'mlforecast.core.TimeSeries._update_known_series': ( 'core.html#timeseries._update_known_series',
+                                                                                      'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries._update_y': ('core.html#timeseries._update_y', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.features': ('core.html#timeseries.features', 'mlforecast/core.py'),
                                  'mlforecast.core.TimeSeries.fit_transform': ('core.html#timeseries.fit_transform', 'mlforecast/core.py'),
@@ -39,9 +47,14 @@ d = { 'settings': { 'branch': 'main',
                                  'mlforecast.core.TimeSeries.update': ('core.html#timeseries.update', 'mlforecast/core.py'),
                                  'mlforecast.core._as_tuple': ('core.html#_as_tuple', 'mlforecast/core.py'),
                                  'mlforecast.core._build_transform_name': ('core.html#_build_transform_name', 'mlforecast/core.py'),
-                                 'mlforecast.core._expand_target': ('core.html#_expand_target', 'mlforecast/core.py'),
+                                 'mlforecast.core._date_feature_value': ('core.html#_date_feature_value', 'mlforecast/core.py'),
+                                 'mlforecast.core._date_features': ('core.html#_date_features', 'mlforecast/core.py'),
                                  'mlforecast.core._identity': ('core.html#_identity', 'mlforecast/core.py'),
-                                 'mlforecast.core._name_models': ('core.html#_name_models', 'mlforecast/core.py')},
+                                 'mlforecast.core._mark_leading_rows': ('core.html#_mark_leading_rows', 'mlforecast/core.py'),
+                                 'mlforecast.core._mark_null_rows': ('core.html#_mark_null_rows', 'mlforecast/core.py'),
+                                 'mlforecast.core._name_models': ('core.html#_name_models', 'mlforecast/core.py'),
+                                 'mlforecast.core._tfm_arg_specs': ('core.html#_tfm_arg_specs', 'mlforecast/core.py'),
+                                 'mlforecast.core._values_dtype': ('core.html#_values_dtype', 'mlforecast/core.py')},
             'mlforecast.distributed.forecast': { 'mlforecast.distributed.forecast.DistributedMLForecast': ( 'distributed.forecast.html#distributedmlforecast',
                                                                                                             'mlforecast/distributed/forecast.py'),
                                                  'mlforecast.distributed.forecast.DistributedMLForecast.__init__': ( 'distributed.forecast.html#distributedmlforecast.__init__',
@@ -159,6 +172,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.take_from_groups': ( 'grouped_array.html#groupedarray.take_from_groups',
                                                                                                       'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray.transform_lags': ( 'grouped_array.html#groupedarray.transform_lags',
+                                                                                                    'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray.transform_many': ( 'grouped_array.html#groupedarray.transform_many',
+                                                                                                    'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array.GroupedArray.transform_rolling_group': ( 'grouped_array.html#groupedarray.transform_rolling_group',
+                                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array.GroupedArray.transform_series': ( 'grouped_array.html#groupedarray.transform_series',
                                                                                                       'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._append_one': ( 'grouped_array.html#_append_one',
@@ -167,15 +186,33 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._apply_difference': ( 'grouped_array.html#_apply_difference',
                                                                                           'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._apply_op': ( 'grouped_array.html#_apply_op',
+                                                                                  'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._diff': ('grouped_array.html#_diff', 'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._expand_target': ( 'grouped_array.html#_expand_target',
                                                                                        'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._is_positive_int': ( 'grouped_array.html#_is_positive_int',
+                                                                                         'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._leading_nulls': ( 'grouped_array.html#_leading_nulls',
+                                                                                       'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._pack_transform': ( 'grouped_array.html#_pack_transform',
+                                                                                        'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._restore_difference': ( 'grouped_array.html#_restore_difference',
                                                                                             'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._restore_fitted_difference': ( 'grouped_array.html#_restore_fitted_difference',
                                                                                                    'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._rolling_group_serie': ( 'grouped_array.html#_rolling_group_serie',
+                                                                                             'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._transform_lags': ( 'grouped_array.html#_transform_lags',
+                                                                                        'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._transform_many': ( 'grouped_array.html#_transform_many',
+                                                                                        'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._transform_rolling_group': ( 'grouped_array.html#_transform_rolling_group',
+                                                                                                 'mlforecast/grouped_array.py'),
                                           'mlforecast.grouped_array._transform_series': ( 'grouped_array.html#_transform_series',
-                                                                                          'mlforecast/grouped_array.py')},
+                                                                                          'mlforecast/grouped_array.py'),
+                                          'mlforecast.grouped_array._transform_series_updates': ( 'grouped_array.html#_transform_series_updates',
+                                                                                                  'mlforecast/grouped_array.py')},
             'mlforecast.lgb_cv': { 'mlforecast.lgb_cv.LightGBMCV': ('lgb_cv.html#lightgbmcv', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV.__init__': ('lgb_cv.html#lightgbmcv.__init__', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV.__repr__': ('lgb_cv.html#lightgbmcv.__repr__', 'mlforecast/lgb_cv.py'),
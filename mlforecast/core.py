@@ -8,14 +8,21 @@ import concurrent.futures
 import inspect
 import warnings
 from collections import Counter, OrderedDict
+from functools import lru_cache
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numba
 import numpy as np
 import pandas as pd
 from numba import njit
 from sklearn.base import BaseEstimator
 
-from .grouped_array import GroupedArray
+from mlforecast.grouped_array import (
+    GroupedArray,
+    _leading_nulls,
+    _pack_transform,
+    _transform_many_ops,
+)
 from .target_transforms import BaseTargetTransform
 from .utils import _ensure_shallow_copy
 
@@ -48,21 +55,140 @@ date_features_dtypes = {
 }
 
 # %% ../nbs/core.ipynb 11
+# builtin date features that are computed in a single pass over the datetime64[ns] values
+_date_feature_ops = {
+    "year": 0,
+    "month": 1,
+    "day": 2,
+    "hour": 3,
+    "minute": 4,
+    "second": 5,
+    "dayofyear": 6,
+    "day_of_year": 6,
+    "dayofweek": 7,
+    "day_of_week": 7,
+    "weekday": 7,
+    "quarter": 8,
+    "daysinmonth": 9,
+    "is_month_start": 10,
+    "is_month_end": 11,
+    "is_quarter_start": 12,
+    "is_quarter_end": 13,
+    "is_year_start": 14,
+    "is_year_end": 15,
+}
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_DAY = 86_400 * _NS_PER_SECOND
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334])
+
+
+@njit(cache=True)
+def _date_feature_value(
+    op: int,
+    year: int,
+    month: int,
+    day: int,
+    seconds: int,
+    dayofyear: int,
+    dayofweek: int,
+    daysinmonth: int,
+) -> int:
+    if op == 0:
+        return year
+    if op == 1:
+        return month
+    if op == 2:
+        return day
+    if op == 3:
+        return seconds // 3_600
+    if op == 4:
+        return seconds // 60 % 60
+    if op == 5:
+        return seconds % 60
+    if op == 6:
+        return dayofyear
+    if op == 7:
+        return dayofweek
+    if op == 8:
+        return (month - 1) // 3 + 1
+    if op == 9:
+        return daysinmonth
+    if op == 10:
+        return day == 1
+    if op == 11:
+        return day == daysinmonth
+    if op == 12:
+        return day == 1 and (month - 1) % 3 == 0
+    if op == 13:
+        return day == daysinmonth and month % 3 == 0
+    if op == 14:
+        return day == 1 and month == 1
+    return day == 31 and month == 12
+
+
+@njit(cache=True)
+def _date_features(
+    dates: np.ndarray,
+    ops_u8: np.ndarray,
+    ops_u16: np.ndarray,
+    out_u8: np.ndarray,
+    out_u16: np.ndarray,
+) -> None:
+    """Compute the date features given by `ops_u8` and `ops_u16` from `dates`,
+    nanoseconds since the epoch, and write them to the rows of `out_u8` and `out_u16`.
+    """
+    for i in range(dates.size):
+        days = dates[i] // _NS_PER_DAY
+        seconds = (dates[i] - days * _NS_PER_DAY) // _NS_PER_SECOND
+        # civil date from days since the epoch (http://howardhinnant.github.io/date_algorithms.html)
+        z = days + 719_468
+        era = z // 146_097
+        doe = z - era * 146_097
+        yoe = (doe - doe // 1_460 + doe // 36_524 - doe // 146_096) // 365
+        doy_march = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy_march + 2) // 153
+        day = doy_march - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (month <= 2)
+        is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        after_feb = is_leap and month > 2
+        dayofyear = _DAYS_BEFORE_MONTH[month - 1] + day + after_feb
+        daysinmonth = _DAYS_IN_MONTH[month - 1] + (is_leap and month == 2)
+        # 1970-01-01 was a thursday
+        dayofweek = (days + 3) % 7
+        for j in range(ops_u8.size):
+            out_u8[j, i] = _date_feature_value(
+                ops_u8[j], year, month, day, seconds, dayofyear, dayofweek, daysinmonth
+            )
+        for j in range(ops_u16.size):
+            out_u16[j, i] = _date_feature_value(
+                ops_u16[j], year, month, day, seconds, dayofyear, dayofweek, daysinmonth
+            )
+
+# %% ../nbs/core.ipynb 12
+@lru_cache(maxsize=None)
+def _tfm_arg_specs(tfm: Callable) -> Tuple[Tuple[str, Any], ...]:
+    """Names and defaults of the arguments of `tfm` after the input array."""
+    params = list(inspect.signature(tfm).parameters.values())[
+        1:
+    ]  # remove input array argument
+    return tuple((p.name, p.default) for p in params)
+
+
 def _build_transform_name(lag, tfm, *args) -> str:
     """Creates a name for a transformation based on `lag`, the name of the function and its arguments."""
     tfm_name = f"{tfm.__name__}_lag{lag}"
-    func_params = inspect.signature(tfm).parameters
-    func_args = list(func_params.items())[1:]  # remove input array argument
     changed_params = [
         f"{name}{value}"
-        for value, (name, arg) in zip(args, func_args)
-        if arg.default != value
+        for value, (name, default) in zip(args, _tfm_arg_specs(tfm))
+        if default != value
     ]
     if changed_params:
         tfm_name += "_" + "_".join(changed_params)
     return tfm_name
 
-# %% ../nbs/core.ipynb 13
+# %% ../nbs/core.ipynb 14
 def _name_models(current_names):
     ctr = Counter(current_names)
     if not ctr:
@@ -80,13 +206,47 @@ def _name_models(current_names):
         names[-i] = name
     return names
 
-# %% ../nbs/core.ipynb 15
+# %% ../nbs/core.ipynb 16
 @njit
 def _identity(x: np.ndarray) -> np.ndarray:
     """Do nothing to the input."""
     return x
 
 
+@njit(cache=True)
+def _mark_null_rows(
+    features, target: np.ndarray, check_target: bool, out: np.ndarray
+) -> None:
+    """Set `out` to True for the rows that have a null in any of `features`
+    or, if `check_target`, in all the columns of `target`."""
+    n = out.size
+    block_size = 4_096
+    n_blocks = (n + block_size - 1) // block_size
+    for b in range(n_blocks):
+        start = b * block_size
+        end = min(start + block_size, n)
+        if check_target:
+            for i in range(start, end):
+                is_null = True
+                for j in range(target.shape[1]):
+                    if not np.isnan(target[i, j]):
+                        is_null = False
+                        break
+                out[i] |= is_null
+        # each block of `out` stays in cache while the features are scanned
+        for k in range(len(features)):
+            x = features[k]
+            for i in range(start, end):
+                out[i] |= np.isnan(x[i])
+
+
+@njit(cache=True)
+def _mark_leading_rows(indptr: np.ndarray, n: int, out: np.ndarray) -> None:
+    """Set `out` to True for the first `n` rows of every group."""
+    for i in range(indptr.size - 1):
+        out[indptr[i] : min(indptr[i] + n, indptr[i + 1])] = True
+
+
 def _as_tuple(x):
     """Return a tuple from the input."""
     if isinstance(x, tuple):
@@ -94,23 +254,13 @@ def _as_tuple(x):
     return (x,)
 
 
-@njit
-def _expand_target(data, indptr, max_horizon):
-    out = np.empty((data.size, max_horizon), dtype=data.dtype)
-    n_series = len(indptr) - 1
-    n = 0
-    for i in range(n_series):
-        serie = data[indptr[i] : indptr[i + 1]]
-        for j in range(serie.size):
-            upper = min(serie.size - j, max_horizon)
-            for k in range(upper):
-                out[n, k] = serie[j + k]
-            for k in range(upper, max_horizon):
-                out[n, k] = np.nan
-            n += 1
-    return out
+def _values_dtype(dtype):
+    """Type of the values of a join key. The categoricals are matched by the values of their categories."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return dtype.categories.dtype
+    return dtype
 
-# %% ../nbs/core.ipynb 16
+# %% ../nbs/core.ipynb 18
 Freq = Union[int, str, pd.offsets.BaseOffset]
 Lags = Iterable[int]
 LagTransform = Union[Callable, Tuple[Callable, Any]]
@@ -118,7 +268,7 @@ LagTransforms = Dict[int, List[LagTransform]]
 DateFeature = Union[str, Callable]
 Models = Union[BaseEstimator, List[BaseEstimator], Dict[str, BaseEstimator]]
 
-# %% ../nbs/core.ipynb 17
+# %% ../nbs/core.ipynb 19
 class TimeSeries:
     """Utility class for storing and transforming time series data."""
 
@@ -130,6 +280,7 @@ class TimeSeries:
         date_features: Optional[Iterable[DateFeature]] = None,
         num_threads: int = 1,
         target_transforms: Optional[List[BaseTargetTransform]] = None,
+        dtype: Optional[Union[type, np.dtype]] = None,
     ):
         if isinstance(freq, str):
             self.freq = pd.tseries.frequencies.to_offset(freq)
@@ -147,11 +298,16 @@ class TimeSeries:
         if not isinstance(num_threads, int) or num_threads < 1:
             warnings.warn("Setting num_threads to 1.")
             num_threads = 1
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if dtype not in (np.float32, np.float64):
+                raise ValueError("dtype must be float32 or float64.")
         self.lags = [] if lags is None else list(lags)
         self.lag_transforms = {} if lag_transforms is None else lag_transforms
         self.date_features = [] if date_features is None else list(date_features)
         self.num_threads = num_threads
         self.target_transforms = target_transforms
+        self.dtype = dtype
         for feature in self.date_features:
             if callable(feature) and feature.__name__ == "<lambda>":
                 raise ValueError(
@@ -166,8 +322,85 @@ class TimeSeries:
                 tfm, *args = _as_tuple(tfm_args)
                 tfm_name = _build_transform_name(lag, tfm, *args)
                 self.transforms[tfm_name] = (lag, tfm, *args)
+        self._pack_transforms()
 
         self.ga: GroupedArray
+        self.y_pred: Optional[np.ndarray]
+        self._n_preds: int
+        # outputs of the per-transform updates reused across the prediction steps
+        self._update_bufs: Dict[str, np.ndarray] = {}
+        self._parallel_update_buf: Optional[np.ndarray] = None
+        # the recursive predictions are appended alternating between these buffers
+        self._append_bufs: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def _pack_transforms(self) -> None:
+        """Store the op codes and arguments of the transformations that are supported by `_pack_transform`.
+
+        The ones that can be computed by `GroupedArray.transform_many` are stored as arrays,
+        the names of the ones that aren't supported are kept in `_unpacked_transforms`.
+        """
+        names, lags, ops, args = [], [], [], []
+        self._unpacked_transforms: List[str] = []
+        for tfm_name, (lag, tfm, *tfm_args) in self.transforms.items():
+            packed: Optional[Tuple[int, Tuple[float, float, float]]]
+            if tfm is _identity:
+                packed = 0, (0.0, 0.0, 0.0)
+            else:
+                packed = _pack_transform(tfm, tuple(tfm_args))
+            if packed is None:
+                self._unpacked_transforms.append(tfm_name)
+                continue
+            names.append(tfm_name)
+            lags.append(lag)
+            ops.append(packed[0])
+            args.append(packed[1])
+        self._packed_transforms = names
+        # over finite values the packed transformations are only null in the first rows of each serie
+        self._packed_leading_nulls = max(
+            (
+                lag + _leading_nulls(op, op_args)
+                for lag, op, op_args in zip(lags, ops, args)
+            ),
+            default=0,
+        )
+        # the lags are computed together by the main process
+        self._lags_transforms = [name for name, op in zip(names, ops) if op == 0]
+        self._lags_arr = np.array(
+            [lag for lag, op in zip(lags, ops) if op == 0], dtype=np.int64
+        )
+        # the transformations computed by numba's parallel kernel when num_threads > 1
+        parallel = [i for i, op in enumerate(ops) if op in _transform_many_ops]
+        self._parallel_transforms = [names[i] for i in parallel]
+        self._parallel_lags = np.array([lags[i] for i in parallel], dtype=np.int64)
+        self._parallel_ops = np.array([ops[i] for i in parallel], dtype=np.int64)
+        self._parallel_args = np.array(
+            [args[i] for i in parallel], dtype=np.float64
+        ).reshape(-1, 3)
+
+        # rolling statistics over the same lag and window are computed in a single pass
+        rolling_groups: Dict[Tuple[int, int, int], List[Tuple[str, int]]] = {}
+        for tfm_name, lag, op, (_, window_size, min_samples) in zip(
+            names, lags, ops, args
+        ):
+            if 1 <= op <= 4:
+                key = (lag, int(window_size), int(min_samples))
+                rolling_groups.setdefault(key, []).append((tfm_name, op))
+        self._rolling_groups = [
+            (
+                lag,
+                window_size,
+                min_samples,
+                [name for name, _ in group],
+                np.array([op for _, op in group]),
+            )
+            for (lag, window_size, min_samples), group in rolling_groups.items()
+            if len(group) > 1
+        ]
+        # the arguments are stored as tuples so that the hot loops don't unpack them at every call
+        self._transforms_fast: List[Tuple[str, int, Callable, Tuple[Any, ...]]] = [
+            (tfm_name, lag, tfm, tuple(tfm_args))
+            for tfm_name, (lag, tfm, *tfm_args) in self.transforms.items()
+        ]
 
     @property
     def _date_feature_names(self):
@@ -218,18 +451,19 @@ class TimeSeries:
         uids, times, _, indptr, sort_idxs = proc.process(sorted_df)
         self.uids = pd.Index(uids)
         self.last_dates = pd.Index(times)
+        self.restore_idxs: Optional[np.ndarray] = None
         if sort_idxs is not None:
             self.restore_idxs = np.empty(df.shape[0], dtype=np.int32)
             self.restore_idxs[sort_idxs] = np.arange(df.shape[0])
             sorted_df = sorted_df.iloc[sort_idxs]
-        else:
-            self.restore_idxs = np.arange(df.shape[0])
         if self.target_transforms is not None:
             for tfm in self.target_transforms:
                 tfm.set_column_names(id_col, time_col, target_col)
                 sorted_df = tfm.fit_transform(sorted_df)
         data = sorted_df[target_col].values
-        if data.dtype not in (np.float32, np.float64):
+        if self.dtype is not None:
+            data = data.astype(self.dtype, copy=False)
+        elif data.dtype not in (np.float32, np.float64):
             data = data.astype(np.float32)
         self.ga = GroupedArray(data, indptr)
         self._ga = GroupedArray(self.ga.data, self.ga.indptr)
@@ -256,45 +490,130 @@ class TimeSeries:
         """
         results = {}
         offset = 1 if updates_only else 0
-        for tfm_name, (lag, tfm, *args) in self.transforms.items():
+        grouped: Dict[str, np.ndarray] = {}
+        # the single pass over each rolling group requires finite values,
+        # otherwise the statistics are computed one at a time by window_ops
+        rolling_groups = self._rolling_groups
+        if rolling_groups and not np.isfinite(self.ga.data).all():
+            rolling_groups = []
+        for lag, window_size, min_samples, names, ops in rolling_groups:
+            stats = self.ga.transform_rolling_group(
+                updates_only, lag - offset, window_size, min_samples, ops
+            )
+            grouped.update(zip(names, stats))
+        if self._lags_transforms:
+            lagged = self.ga.transform_lags(updates_only, self._lags_arr - offset)
+            grouped.update(zip(self._lags_transforms, lagged))
+        for tfm_name, lag, tfm, args in self._transforms_fast:
+            if tfm_name in grouped:
+                results[tfm_name] = grouped[tfm_name]
+                continue
             results[tfm_name] = self.ga.transform_series(
-                updates_only, lag - offset, tfm, *args
+                updates_only,
+                lag - offset,
+                tfm,
+                *args,
+                out=self._update_bufs.get(tfm_name) if updates_only else None,
             )
         return results
 
     def _apply_multithreaded_transforms(
         self, updates_only: bool = False
     ) -> Dict[str, np.ndarray]:
-        """Apply the transformations using multithreading.
+        """Apply the transformations using numba's parallel kernels.
 
+        The transformations that `GroupedArray.transform_many` doesn't support are computed
+        by the serial kernel in a thread pool, since the errors raised inside the parallel kernels are lost.
         If `updates_only` then only the updates are returned.
         """
-        future_to_result = {}
         results = {}
         offset = 1 if updates_only else 0
-        with concurrent.futures.ThreadPoolExecutor(self.num_threads) as executor:
-            for tfm_name, (lag, tfm, *args) in self.transforms.items():
-                future = executor.submit(
-                    self.ga.transform_series,
+        prev_num_threads = numba.get_num_threads()
+        numba.set_num_threads(min(self.num_threads, numba.config.NUMBA_NUM_THREADS))
+        try:
+            if self._parallel_transforms:
+                parallel_results = self.ga.transform_many(
                     updates_only,
-                    lag - offset,
-                    tfm,
-                    *args,
+                    offset,
+                    self._parallel_lags,
+                    self._parallel_ops,
+                    self._parallel_args,
+                    out=self._parallel_update_buf if updates_only else None,
                 )
-                future_to_result[future] = tfm_name
-            for future in concurrent.futures.as_completed(future_to_result):
-                tfm_name = future_to_result[future]
-                results[tfm_name] = future.result()
-        return results
+                for tfm_name, tfm_values in zip(
+                    self._parallel_transforms, parallel_results
+                ):
+                    results[tfm_name] = tfm_values
+        finally:
+            numba.set_num_threads(prev_num_threads)
+        if len(results) < len(self.transforms):
+            future_to_result = {}
+            with concurrent.futures.ThreadPoolExecutor(self.num_threads) as executor:
+                for tfm_name, lag, tfm, args in self._transforms_fast:
+                    if tfm_name in results:
+                        continue
+                    future = executor.submit(
+                        self.ga.transform_series,
+                        updates_only,
+                        lag - offset,
+                        tfm,
+                        *args,
+                    )
+                    future_to_result[future] = tfm_name
+                for future in concurrent.futures.as_completed(future_to_result):
+                    tfm_name = future_to_result[future]
+                    results[tfm_name] = future.result()
+        return {tfm_name: results[tfm_name] for tfm_name in self.transforms}
 
     def _compute_transforms(self) -> Dict[str, np.ndarray]:
         """Compute the transformations defined in the constructor.
 
-        If `self.num_threads > 1` these are computed using multithreading."""
-        if self.num_threads == 1 or len(self.transforms) == 1:
+        If `self.num_threads > 1` these are computed using numba's parallel kernels."""
+        if self.num_threads == 1:
             return self._apply_transforms()
         return self._apply_multithreaded_transforms()
 
+    def _compute_date_features(self, dates) -> Dict[str, np.ndarray]:
+        """Compute all the date features.
+
+        The builtin features supported by `_date_features` are computed together in a single pass over the dates.
+        """
+        builtin = []
+        if (
+            isinstance(dates, pd.DatetimeIndex)
+            and dates.dtype == "datetime64[ns]"
+            and dates.freq is None
+            and not dates.hasnans
+        ):
+            builtin = [
+                f
+                for f in self.date_features
+                if isinstance(f, str) and f in _date_feature_ops
+            ]
+        computed: Dict[str, np.ndarray] = {}
+        if builtin:
+            u8 = [f for f in builtin if date_features_dtypes[f] == np.uint8]
+            u16 = [f for f in builtin if date_features_dtypes[f] == np.uint16]
+            out_u8 = np.empty((len(u8), dates.size), dtype=np.uint8)
+            out_u16 = np.empty((len(u16), dates.size), dtype=np.uint16)
+            _date_features(
+                dates.asi8,
+                np.array([_date_feature_ops[f] for f in u8], dtype=np.int64),
+                np.array([_date_feature_ops[f] for f in u16], dtype=np.int64),
+                out_u8,
+                out_u16,
+            )
+            computed.update(zip(u8, out_u8))
+            computed.update(zip(u16, out_u16))
+        features = {}
+        for feature in self.date_features:
+            if isinstance(feature, str) and feature in computed:
+                features[feature] = computed[feature]
+            else:
+                feat_name, feat_vals = self._compute_date_feature(dates, feature)
+                features[feat_name] = feat_vals
+        return features
+
     def _compute_date_feature(self, dates, feature):
         if callable(feature):
             feat_name = feature.__name__
@@ -310,6 +629,33 @@ class TimeSeries:
             vals = vals.astype(feat_dtype)
         return feat_name, vals
 
+    def _null_rows(
+        self, features: Dict[str, np.ndarray], target: np.ndarray
+    ) -> np.ndarray:
+        """Mask of the rows with a null feature or a null target."""
+        # target nulls for each horizon are dropped in MLForecast.fit_models
+        # we just drop rows here for which all the target values are null
+        target = target.reshape(target.shape[0], -1)
+        out = np.full(target.shape[0], False)
+        if self._packed_transforms and np.isfinite(self.ga.data).all():
+            # the nulls of the packed transformations are known, only the rest are scanned
+            _mark_leading_rows(self.ga.indptr, self._packed_leading_nulls, out)
+            features = {name: features[name] for name in self._unpacked_transforms}
+        # the features are scanned in one pass per array type
+        by_type: Dict[Any, numba.typed.List] = {}
+        for feature_vals in features.values():
+            typ = numba.typeof(feature_vals)
+            if typ not in by_type:
+                by_type[typ] = numba.typed.List.empty_list(typ)
+            by_type[typ].append(feature_vals)
+        if not by_type:
+            typ = numba.typeof(target[:0, 0].copy())
+            by_type[typ] = numba.typed.List.empty_list(typ)
+        for i, typed_features in enumerate(by_type.values()):
+            # the target only needs to be checked once
+            _mark_null_rows(typed_features, target, i == 0, out)
+        return out
+
     def _transform(
         self,
         df: pd.DataFrame,
@@ -320,53 +666,74 @@ class TimeSeries:
         """Add the features to `df`.
 
         if `dropna=True` then all the null rows are dropped."""
-        features = {
-            k: v[self.restore_idxs] for k, v in self._compute_transforms().items()
-        }
+        # the features and target are computed over the sorted series
+        features = self._compute_transforms()
 
         # target
         self.max_horizon = max_horizon
         if max_horizon is None:
-            target = self.ga.data[self.restore_idxs]
+            target = self.ga.data
         else:
-            target = self.ga.expand_target(max_horizon)[self.restore_idxs]
+            target = self.ga.expand_target(max_horizon)
 
         # determine rows to keep
+        keep_rows: Optional[np.ndarray] = None
         if dropna:
-            feature_nulls = np.full(df.shape[0], False)
-            for feature_vals in features.values():
-                feature_nulls |= np.isnan(feature_vals)
-            target_nulls = np.isnan(target)
-            if target_nulls.ndim == 2:
-                # target nulls for each horizon are dropped in MLForecast.fit_models
-                # we just drop rows here for which all the target values are null
-                target_nulls = target_nulls.all(axis=1)
-            keep_rows = ~(feature_nulls | target_nulls)
-            df = df[keep_rows].copy(deep=False)
-            target = target[keep_rows]
+            keep = ~self._null_rows(features, target)
+            if self.restore_idxs is not None:
+                keep = keep[self.restore_idxs]
+            df = df[keep].copy(deep=False)
+            keep_rows = keep
         else:
-            keep_rows = np.full(df.shape[0], True)
             df = df.copy(deep=False)
 
+        # positions in the sorted series of the rows in df, so that
+        # reordering and dropping rows is a single gather per feature
+        rows: Optional[np.ndarray]
+        if self.restore_idxs is None:
+            rows = keep_rows
+        elif keep_rows is None:
+            rows = self.restore_idxs
+        else:
+            rows = self.restore_idxs[keep_rows]
+        if rows is not None:
+            target = target[rows]
+        elif max_horizon is None:
+            # don't expose the stored series
+            target = target.copy()
+
         # lag transforms
         for feat in self.transforms.keys():
-            df[feat] = features[feat][keep_rows]
+            df[feat] = features[feat] if rows is None else features[feat][rows]
 
         # date features
         if self.date_features:
             dates = df[self.time_col]
             if not np.issubdtype(dates.dtype.type, np.integer):
                 dates = pd.DatetimeIndex(dates)
-            for feature in self.date_features:
-                feat_name, feat_vals = self._compute_date_feature(dates, feature)
-                df[feat_name] = feat_vals
+            date_features = self._compute_date_features(dates)
+            if df.columns.intersection(list(date_features.keys())).empty:
+                # a single block per dtype instead of one insertion per feature
+                date_df = pd.DataFrame(date_features, index=df.index)
+                df = pd.concat([df, date_df], axis=1, copy=False)
+            else:
+                for feat_name, feat_vals in date_features.items():
+                    df[feat_name] = feat_vals
 
         # assemble return
         if return_X_y:
             return df, target
         if max_horizon is not None:
-            for i in range(max_horizon):
-                df[f"{self.target_col}{i}"] = target[:, i]
+            target_names = [f"{self.target_col}{i}" for i in range(max_horizon)]
+            if df.columns.intersection(target_names).empty:
+                # all the horizons are added as a single block
+                target_df = pd.DataFrame(
+                    target, columns=target_names, index=df.index, copy=False
+                )
+                df = pd.concat([df, target_df], axis=1, copy=False)
+            else:
+                for i, name in enumerate(target_names):
+                    df[name] = target[:, i]
         else:
             df = _ensure_shallow_copy(df)
             df[self.target_col] = target
@@ -401,70 +768,149 @@ class TimeSeries:
 
         These values are used to update the transformations and are stored as predictions.
         """
-        if not hasattr(self, "y_pred"):
-            self.y_pred = []
-        self.y_pred.append(new)
         new_arr = np.asarray(new)
-        self.ga = self.ga.append(new_arr)
+        if self.y_pred is None:
+            self.y_pred = np.empty(
+                (new_arr.size, self.test_dates.shape[1]), dtype=new_arr.dtype
+            )
+        self.y_pred[:, self._n_preds] = new_arr
+        size = self.ga.data.size + self.ga.ngroups
+        if self._append_bufs is None or self._append_bufs[0].size < size:
+            # room for the remaining steps, reused by the next models
+            n_steps = self.test_dates.shape[1] - self._n_preds
+            buf_size = self.ga.data.size + n_steps * self.ga.ngroups
+            self._append_bufs = (
+                np.empty(buf_size, dtype=self.ga.data.dtype),
+                np.empty(buf_size, dtype=self.ga.data.dtype),
+            )
+        # the current data is in the other buffer (or the stored series)
+        self.ga = self.ga.append(new_arr, out=self._append_bufs[self._n_preds % 2])
+        self._n_preds += 1
 
     def _update_features(self) -> pd.DataFrame:
         """Compute the current values of all the features using the latest values of the time series."""
-        if not hasattr(self, "curr_dates"):
-            self.curr_dates = self.last_dates.copy()
-            self.test_dates = []
         self.curr_dates += self.freq
-        self.test_dates.append(self.curr_dates)
+        self.test_dates[:, self._n_preds] = self.curr_dates
 
-        if self.num_threads == 1 or len(self.transforms) == 1:
+        if self.num_threads == 1:
             features = self._apply_transforms(updates_only=True)
         else:
             features = self._apply_multithreaded_transforms(updates_only=True)
 
-        for feature in self.date_features:
-            feat_name, feat_vals = self._compute_date_feature(self.curr_dates, feature)
-            features[feat_name] = feat_vals
+        features.update(self._compute_date_features(self.curr_dates))
 
-        features_df = pd.DataFrame(features, columns=self.features)
-        features_df[self.id_col] = self._uids
-        features_df[self.time_col] = self.curr_dates
-        return self.static_features_.merge(features_df, on=self.id_col)
+        # the statics are aligned with the series, so the columns are just stacked
+        columns = {col: self._curr_statics[col] for col in self._curr_statics.columns}
+        columns.update({feat: features[feat] for feat in self.features})
+        columns[self.time_col] = self.curr_dates
+        # the updates live in buffers that are overwritten in the next step
+        return pd.DataFrame(columns, copy=True)
 
     def _get_raw_predictions(self) -> np.ndarray:
-        return np.array(self.y_pred).ravel("F")
+        assert self.y_pred is not None
+        # each row holds the predictions of a serie, so this is a view when the horizon is complete
+        return self.y_pred[:, : self._n_preds].ravel()
 
     def _get_predictions(self) -> pd.DataFrame:
         """Get all the predicted values with their corresponding ids and datestamps."""
-        n_preds = len(self.y_pred)
+        n_preds = self._n_preds
         uids = pd.Series(
             np.repeat(self._uids, n_preds), name=self.id_col, dtype=self.uids.dtype
         )
         df = pd.DataFrame(
             {
                 self.id_col: uids,
-                self.time_col: np.array(self.test_dates).ravel("F"),
+                self.time_col: self.test_dates[:, :n_preds].ravel(),
                 f"{self.target_col}_pred": self._get_raw_predictions(),
             },
         )
         return df
 
-    def _predict_setup(self) -> None:
+    def _predict_setup(self, horizon: int = 1) -> None:
+        """Reset the series and allocate the buffers for the predictions of the next `horizon` steps."""
         self.ga = GroupedArray(self._ga.data, self._ga.indptr)
         self.curr_dates = self.last_dates.copy()
+        # static features of the series being predicted, aligned with them
+        self._curr_statics = self.static_features_
         if self._idxs is not None:
             self.ga = self.ga.take(self._idxs)
             self.curr_dates = self.curr_dates[self._idxs]
-        self.test_dates = []
-        self.y_pred = []
+            self._curr_statics = self._curr_statics.iloc[self._idxs].reset_index(
+                drop=True
+            )
+        # one row per serie and one column per step
+        self.test_dates = np.empty(
+            (len(self.curr_dates), horizon), dtype=self.curr_dates.dtype
+        )
+        self.y_pred = None
+        self._n_preds = 0
+        self._dynamic_lookups: Optional[
+            List[Tuple[List[str], pd.MultiIndex, pd.DataFrame]]
+        ] = None
+        self._dynamic_merge = False
         if self.keep_last_n is not None:
             self.ga = self.ga.take_from_groups(slice(-self.keep_last_n, None))
+        if self.num_threads == 1:
+            # the lags and rolling groups are computed together and don't need buffers
+            grouped = set(self._lags_transforms)
+            for *_, names, _ in self._rolling_groups:
+                grouped.update(names)
+            self._update_bufs = {
+                name: np.empty(self.ga.ngroups, dtype=self.ga.data.dtype)
+                for name in self.transforms
+                if name not in grouped
+            }
+        elif self._parallel_transforms:
+            self._parallel_update_buf = np.empty(
+                (len(self._parallel_transforms), self.ga.ngroups),
+                dtype=self.ga.data.dtype,
+            )
         self._h = 0
 
+    def _join_dynamic(
+        self, new_x: pd.DataFrame, dynamic_dfs: List[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Left join `new_x` with each of `dynamic_dfs` on their common columns.
+
+        The index over the keys of each dynamic df is built in the first step and reused in the next ones.
+        """
+        if self._dynamic_lookups is None:
+            self._dynamic_lookups = []
+            dtypes = new_x.dtypes.to_dict()
+            for df in dynamic_dfs:
+                keys = [col for col in dtypes if col in df.columns]
+                same_dtypes = all(
+                    _values_dtype(df[col].dtype) == _values_dtype(dtypes[col])
+                    for col in keys
+                )
+                values = df.drop(columns=keys).reset_index(drop=True)
+                dtypes.update(values.dtypes.to_dict())
+                index = pd.MultiIndex.from_frame(df[keys])
+                self._dynamic_lookups.append((keys, index, values))
+                # rows can get repeated or the keys may need to be cast (or not match at all),
+                # in which case the regular merge is used
+                self._dynamic_merge = self._dynamic_merge or not (
+                    keys and same_dtypes and index.is_unique
+                )
+        if self._dynamic_merge:
+            for df in dynamic_dfs:
+                new_x = new_x.merge(df, how="left")
+            return new_x.sort_values(self.id_col)
+        for keys, index, values in self._dynamic_lookups:
+            positions = index.get_indexer(pd.MultiIndex.from_frame(new_x[keys]))
+            if (positions >= 0).all():
+                joined = values.take(positions)
+            else:
+                # missing positions produce nulls, as in a left merge
+                joined = values.reindex(positions)
+            joined.index = new_x.index
+            new_x = pd.concat([new_x, joined], axis=1)
+        return new_x
+
     def _get_features_for_next_step(self, dynamic_dfs, X_df=None):
         new_x = self._update_features()
         if dynamic_dfs:
-            for df in dynamic_dfs:
-                new_x = new_x.merge(df, how="left")
-            new_x = new_x.sort_values(self.id_col)
+            new_x = self._join_dynamic(new_x, dynamic_dfs)
         if X_df is not None:
             n_series = len(self._uids)
             X = X_df.iloc[self._h * n_series : (self._h + 1) * n_series]
@@ -488,7 +934,7 @@ class TimeSeries:
         if dynamic_dfs is None:
             dynamic_dfs = []
         for i, (name, model) in enumerate(models.items()):
-            self._predict_setup()
+            self._predict_setup(horizon)
             for _ in range(horizon):
                 new_x = self._get_features_for_next_step(dynamic_dfs, X_df)
                 if before_predict_callback is not None:
@@ -523,19 +969,22 @@ class TimeSeries:
         if dynamic_dfs is None:
             dynamic_dfs = []
         uids = np.repeat(self._uids, horizon)
-        dates = np.hstack(
-            [
-                date + (i + 1) * self.freq
-                for date in self.last_dates
-                for i in range(horizon)
-            ]
-        )
+        last_dates = self.last_dates
+        if self._idxs is not None:
+            last_dates = last_dates[self._idxs]
+        # one vectorized offset per step, laid out as one row per serie
+        dates = np.stack(
+            [np.asarray(last_dates + (i + 1) * self.freq) for i in range(horizon)],
+            axis=1,
+        ).ravel()
         result = pd.DataFrame({self.id_col: uids, self.time_col: dates})
+        # the features don't depend on the predictions, so all models share them
+        self._predict_setup()
+        features = self._get_features_for_next_step(dynamic_dfs, X_df)
         for name, model in models.items():
-            self._predict_setup()
-            new_x = self._get_features_for_next_step(dynamic_dfs, X_df)
+            new_x = features
             if before_predict_callback is not None:
-                new_x = before_predict_callback(new_x)
+                new_x = before_predict_callback(features.copy())
             predictions = np.empty((new_x.shape[0], horizon))
             for i in range(horizon):
                 predictions[:, i] = model[i].predict(new_x)
@@ -622,12 +1071,56 @@ class TimeSeries:
                 preds = tfm.inverse_transform(preds)
                 tfm.idxs = None
         del self._uids, self._idxs
+        self._update_bufs = {}
+        self._parallel_update_buf = None
+        self._append_bufs = None
         return preds
 
+    def _update_known_series(
+        self, df: pd.DataFrame, new_sizes: pd.Series, positions: np.ndarray
+    ) -> None:
+        """Update the stored series when every id in `df` was already seen.
+
+        The last dates and static features of the updated series are written by position
+        into copies of the current ones, instead of going through set_index/reindex/update.
+        """
+        sizes = np.zeros(self.uids.size, dtype=np.int32)
+        sizes[positions] = new_sizes.values
+        new_dates = df.groupby(self.id_col, observed=True)[self.time_col].max()
+        last_dates = pd.Series(self.last_dates)
+        last_dates.iloc[positions] = new_dates.array
+        self.last_dates = pd.Index(last_dates, name=self.time_col).astype(
+            self.last_dates.dtype
+        )
+        new_statics = df.iloc[new_sizes.cumsum().values - 1]
+        # same column order and dtypes as the reset_index + astype in update
+        cols = [self.id_col] + [
+            c for c in self.static_features_.columns if c != self.id_col
+        ]
+        statics = {}
+        for col in cols:
+            dtype = self.static_features_[col].dtype
+            vals = self.static_features_[col].array.copy()
+            if col != self.id_col and col in new_statics:
+                new_vals = new_statics[col]
+                valid = new_vals.notna().values
+                vals[positions[valid]] = new_vals[valid].astype(dtype).array
+            statics[col] = pd.Series(vals, dtype=dtype)
+        self.static_features_ = pd.DataFrame(statics)
+        self._ga = self._ga.append_several(
+            new_sizes=sizes,
+            new_values=df[self.target_col].values,
+            new_groups=np.full(self.uids.size, False),
+        )
+
     def update(self, df: pd.DataFrame) -> None:
         """Update the values of the stored series."""
         df = df.sort_values([self.id_col, self.time_col])
         new_sizes = df.groupby(self.id_col, observed=True).size()
+        positions = self.uids.get_indexer(new_sizes.index)
+        if (positions >= 0).all():
+            self._update_known_series(df, new_sizes, positions)
+            return
         prev_sizes = pd.Series(np.full(self.uids.size, 0), index=self.uids)
         sizes = new_sizes.add(prev_sizes, fill_value=0)
         values = df[self.target_col].values
@@ -7,7 +7,7 @@ __all__ = ['DistributedMLForecast']
 import copy
 import warnings
 from collections import namedtuple
-from typing import Any, Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, Union
 
 import cloudpickle
 
@@ -19,6 +19,7 @@ except ModuleNotFoundError:
     DASK_INSTALLED = False
 import fugue
 import fugue.api as fa
+import numpy as np
 import pandas as pd
 
 try:
@@ -66,6 +67,7 @@ class DistributedMLForecast:
         date_features: Optional[Iterable[DateFeature]] = None,
         num_threads: int = 1,
         target_transforms: Optional[List[BaseTargetTransform]] = None,
+        dtype: Optional[Union[type, np.dtype]] = None,
         engine=None,
         num_partitions: Optional[int] = None,
     ):
@@ -85,8 +87,14 @@ class DistributedMLForecast:
             Features computed from the dates. Can be pandas date attributes or functions that will take the dates as input.
         num_threads : int (default=1)
             Number of threads to use when computing the features.
+            Values greater than 1 use numba's parallel kernels, which start its threading layer.
+            Depending on the layer, this makes forking the process afterwards unsafe
+            and fitting concurrently from several threads can fail.
         target_transforms : list of transformers, optional(default=None)
             Transformations that will be applied to the target before computing the features and restored after the forecasting step.
+        dtype : numpy float dtype, optional (default=None)
+            Type used to store the target and compute the features, either float32 or float64.
+            If None, float targets keep their type and the rest are cast to float32.
         engine : fugue execution engine, optional (default=None)
             Dask Client, Spark Session, etc to use for the distributed computation.
             If None will infer depending on the input type.
@@ -111,6 +119,7 @@ class DistributedMLForecast:
             date_features=date_features,
             num_threads=num_threads,
             target_transforms=target_transforms,
+            dtype=dtype,
         )
         self.engine = engine
         self.num_partitions = num_partitions
@@ -127,6 +127,7 @@ class MLForecast:
         date_features: Optional[Iterable[DateFeature]] = None,
         num_threads: int = 1,
         target_transforms: Optional[List[BaseTargetTransform]] = None,
+        dtype: Optional[Union[type, np.dtype]] = None,
     ):
         """Forecasting pipeline
 
@@ -144,8 +145,14 @@ class MLForecast:
             Features computed from the dates. Can be pandas date attributes or functions that will take the dates as input.
         num_threads : int (default=1)
             Number of threads to use when computing the features.
+            Values greater than 1 use numba's parallel kernels, which start its threading layer.
+            Depending on the layer, this makes forking the process afterwards unsafe
+            and fitting concurrently from several threads can fail.
         target_transforms : list of transformers, optional(default=None)
             Transformations that will be applied to the target before computing the features and restored after the forecasting step.
+        dtype : numpy float dtype, optional (default=None)
+            Type used to store the target and compute the features, either float32 or float64.
+            If None, float targets keep their type and the rest are cast to float32.
         """
         if not isinstance(models, dict) and not isinstance(models, list):
             models = [models]
@@ -162,6 +169,7 @@ class MLForecast:
             date_features=date_features,
             num_threads=num_threads,
             target_transforms=target_transforms,
+            dtype=dtype,
         )
 
     def __repr__(self):
@@ -568,6 +576,7 @@ class MLForecast:
                 date_features=self.ts.date_features,
                 num_threads=self.ts.num_threads,
                 target_transforms=self.ts.target_transforms,
+                dtype=self.ts.dtype,
             )
             new_ts._fit(
                 new_df,
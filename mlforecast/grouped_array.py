@@ -4,13 +4,32 @@
 __all__ = ['GroupedArray']
 
 # %% ../nbs/grouped_array.ipynb 1
-from typing import TYPE_CHECKING, Callable, Tuple, Union
+from math import sqrt
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     import pandas as pd
 import numpy as np
-from numba import njit
+from numba import njit, prange
+from window_ops.ewm import ewm_mean
+from window_ops.expanding import (
+    expanding_max,
+    expanding_mean,
+    expanding_min,
+    expanding_std,
+)
+from window_ops.rolling import (
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    seasonal_rolling_max,
+    seasonal_rolling_mean,
+    seasonal_rolling_min,
+    seasonal_rolling_std,
+)
 from window_ops.shift import shift_array
+from window_ops.utils import first_not_na
 
 # %% ../nbs/grouped_array.ipynb 2
 @njit(nogil=True)
@@ -33,6 +52,245 @@ def _transform_series(data, indptr, updates_only, lag, func, *args) -> np.ndarra
     return out
 
 
+@njit(nogil=True)
+def _transform_series_updates(data, indptr, lag, out, func, *args) -> None:
+    """Same as `_transform_series` with `updates_only=True`, writing the updates to `out`."""
+    for i in range(len(indptr) - 1):
+        lagged = shift_array(data[indptr[i] : indptr[i + 1]], lag)
+        out[i] = func(lagged, *args)[-1]
+
+
+# op codes of the lag transformations, used to identify them and their arguments.
+# 0 is reserved for lags, i.e. the shifted values are returned as is.
+_lag_transform_ops = {
+    rolling_mean: 1,
+    rolling_std: 2,
+    rolling_min: 3,
+    rolling_max: 4,
+    expanding_mean: 5,
+    expanding_std: 6,
+    expanding_min: 7,
+    expanding_max: 8,
+    ewm_mean: 9,
+    seasonal_rolling_mean: 10,
+    seasonal_rolling_std: 11,
+    seasonal_rolling_min: 12,
+    seasonal_rolling_max: 13,
+}
+# op codes computed by `_transform_many`. The window_ops implementations of most of the rest
+# take functions as arguments, which keeps numba from caching the compiled kernel,
+# and expanding_std raises for groups of size 1, which would be lost in the parallel loop.
+_transform_many_ops = frozenset({0, 1, 2, 5, 9})
+
+
+def _is_positive_int(x) -> bool:
+    return isinstance(x, (int, np.integer)) and not isinstance(x, bool) and bool(x > 0)
+
+
+def _pack_transform(
+    func: Callable, args: Tuple
+) -> Optional[Tuple[int, Tuple[float, float, float]]]:
+    """Returns the op code and arguments that identify the transformation `func(x, *args)`.
+
+    If `func` isn't supported or its arguments can't be packed `None` is returned,
+    in which case the transformation has to be computed with `_transform_series`.
+    Only the op codes in `_transform_many_ops` can be computed with `_transform_many`.
+    """
+    op = _lag_transform_ops.get(func)
+    if op is None:
+        return None
+    if 5 <= op <= 8:
+        if args:
+            return None
+        return op, (0.0, 0.0, 0.0)
+    if op == 9:
+        if len(args) != 1 or not isinstance(args[0], (int, float, np.number)):
+            return None
+        return op, (float(args[0]), 0.0, 0.0)
+    if op < 5:
+        season_length, sizes = 1, args
+    elif args:
+        season_length, sizes = args[0], args[1:]
+    else:
+        return None
+    if not 1 <= len(sizes) <= 2:
+        return None
+    window_size = sizes[0]
+    min_samples = sizes[1] if len(sizes) == 2 and sizes[1] is not None else window_size
+    if not all(_is_positive_int(x) for x in (season_length, window_size, min_samples)):
+        return None
+    min_samples = min(min_samples, window_size)
+    if op in (2, 11) and min_samples < 2:
+        # raising inside the parallel kernel loses the error, let window_ops raise it
+        # in `_transform_series`.
+        return None
+    return op, (float(season_length), float(window_size), float(min_samples))
+
+
+def _leading_nulls(op: int, args: Tuple[float, float, float]) -> int:
+    """Number of nulls at the start of the transformation packed as `op` and `args`
+    when it's computed over a serie of finite values."""
+    season_length, _, min_samples = args
+    if 1 <= op <= 4:
+        return int(min_samples) - 1
+    if op == 6:
+        return 1
+    if op >= 10:
+        return int(season_length) * (int(min_samples) - 1)
+    return 0
+
+
+@njit(cache=True)
+def _apply_op(op, x, args):
+    """Computes the lag transformation identified by `op`, one of `_transform_many_ops`, on `x`."""
+    if op == 0:
+        return x
+    window_size, min_samples = int(args[1]), int(args[2])
+    if op == 1:
+        return rolling_mean(x, window_size, min_samples)
+    if op == 2:
+        return rolling_std(x, window_size, min_samples)
+    if op == 5:
+        return expanding_mean(x)
+    return ewm_mean(x, args[0])
+
+
+@njit(parallel=True, cache=True)
+def _transform_many(data, indptr, updates_only, offset, lags, ops, args, out) -> None:
+    """Computes several lag transformations in a single parallel loop over (transformation, group).
+
+    Every group in `data` is shifted by `lags[j] - offset` and the transformation with op code `ops[j]`
+    and arguments `args[j]` is applied to it and written to the row `j` of `out`.
+    If `updates_only=True` only the last value of each transformation for each group is written.
+    """
+    n_series = len(indptr) - 1
+    n_tfms = lags.size
+    for k in prange(n_tfms * n_series):
+        j = k // n_series
+        i = k - j * n_series
+        lagged = shift_array(data[indptr[i] : indptr[i + 1]], lags[j] - offset)
+        transformed = _apply_op(ops[j], lagged, args[j])
+        if updates_only:
+            out[j, i] = transformed[-1]
+        else:
+            out[j, indptr[i] : indptr[i + 1]] = transformed
+
+
+@njit(cache=True)
+def _rolling_group_serie(x, window_size, min_samples, ops) -> np.ndarray:
+    """Computes the rolling statistics in `ops` over the same window in a single pass over `x`.
+
+    The mean is updated with a running sum, the standard deviation with Welford's algorithm
+    (same updates as window_ops) and the min and max with monotonic deques of indices.
+    """
+    n_samples = x.size
+    out = np.full((ops.size, n_samples), np.nan, dtype=x.dtype)
+    start_idx = first_not_na(x)
+    if start_idx + min_samples > n_samples:
+        return out
+
+    accum = 0.0
+    prev_avg = 0.0
+    curr_avg = x[start_idx]
+    m2 = 0.0
+    min_idxs = np.empty(n_samples, dtype=np.int64)
+    min_head = min_tail = 0
+    max_idxs = np.empty(n_samples, dtype=np.int64)
+    max_head = max_tail = 0
+    for i in range(start_idx, n_samples):
+        if i < start_idx + window_size:
+            n_obs = i - start_idx + 1
+            accum += x[i]
+            if i > start_idx:
+                prev_avg = curr_avg
+                curr_avg = prev_avg + (x[i] - prev_avg) / n_obs
+                m2 += (x[i] - prev_avg) * (x[i] - curr_avg)
+                m2 = max(m2, 0.0)
+        else:
+            n_obs = window_size
+            new_minus_old = x[i] - x[i - window_size]
+            accum += new_minus_old
+            prev_avg = curr_avg
+            curr_avg = prev_avg + new_minus_old / window_size
+            m2 += new_minus_old * (x[i] - curr_avg + x[i - window_size] - prev_avg)
+            m2 = max(m2, 0.0)
+        while min_tail > min_head and x[min_idxs[min_tail - 1]] >= x[i]:
+            min_tail -= 1
+        min_idxs[min_tail] = i
+        min_tail += 1
+        if min_idxs[min_head] <= i - window_size:
+            min_head += 1
+        while max_tail > max_head and x[max_idxs[max_tail - 1]] <= x[i]:
+            max_tail -= 1
+        max_idxs[max_tail] = i
+        max_tail += 1
+        if max_idxs[max_head] <= i - window_size:
+            max_head += 1
+        if i + 1 < start_idx + min_samples:
+            continue
+        for j in range(ops.size):
+            if ops[j] == 1:
+                out[j, i] = accum / n_obs
+            elif ops[j] == 2:
+                out[j, i] = sqrt(m2 / (n_obs - 1))
+            elif ops[j] == 3:
+                out[j, i] = x[min_idxs[min_head]]
+            else:
+                out[j, i] = x[max_idxs[max_head]]
+    return out
+
+
+@njit(cache=True)
+def _transform_rolling_group(
+    data, indptr, updates_only, lag, window_size, min_samples, ops
+) -> np.ndarray:
+    """Shifts every group in `data` by `lag` and computes the rolling statistics in `ops`
+    (op codes of `rolling_mean`, `rolling_std`, `rolling_min` and `rolling_max`) in a single pass.
+
+    The result has one row per element of `ops`.
+    If `updates_only=True` only the last value of each statistic for each group is returned.
+    """
+    n_series = len(indptr) - 1
+    if updates_only:
+        out = np.empty((ops.size, n_series), dtype=data.dtype)
+    else:
+        out = np.empty((ops.size, data.size), dtype=data.dtype)
+    for i in range(n_series):
+        lagged = shift_array(data[indptr[i] : indptr[i + 1]], lag)
+        stats = _rolling_group_serie(lagged, window_size, min_samples, ops)
+        if updates_only:
+            out[:, i] = stats[:, -1]
+        else:
+            out[:, indptr[i] : indptr[i + 1]] = stats
+    return out
+
+
+@njit(cache=True)
+def _transform_lags(data, indptr, updates_only, lags) -> np.ndarray:
+    """Shifts every group in `data` by each of `lags`, without calling a transformation.
+
+    The result has one row per lag. If `updates_only=True` only the last value of each group is returned.
+    """
+    n_series = len(indptr) - 1
+    n_lags = lags.size
+    if updates_only:
+        out = np.empty((n_lags, n_series), dtype=data.dtype)
+    else:
+        out = np.empty((n_lags, data.size), dtype=data.dtype)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        size = end - start
+        for j in range(n_lags):
+            lag = lags[j]
+            if updates_only:
+                out[j, i] = data[end - 1 - lag] if size > lag else np.nan
+            else:
+                n_nans = min(lag, size)
+                out[j, start : start + n_nans] = np.nan
+                out[j, start + n_nans : end] = data[start : end - n_nans]
+    return out
+
+
 @njit
 def _diff(x, lag):
     y = x.copy()
@@ -80,28 +338,22 @@ def _restore_fitted_difference(diffs_data, diffs_indptr, data, indptr, d):
 
 @njit
 def _expand_target(data, indptr, max_horizon):
-    out = np.empty((data.size, max_horizon), dtype=data.dtype)
+    out = np.full((data.size, max_horizon), np.nan, dtype=data.dtype)
     n_series = len(indptr) - 1
-    n = 0
     for i in range(n_series):
         serie = data[indptr[i] : indptr[i + 1]]
         for j in range(serie.size):
             upper = min(serie.size - j, max_horizon)
-            for k in range(upper):
-                out[n, k] = serie[j + k]
-            for k in range(upper, max_horizon):
-                out[n, k] = np.nan
-            n += 1
+            out[indptr[i] + j, :upper] = serie[j : j + upper]
     return out
 
 
 @njit
 def _append_one(
-    data: np.ndarray, indptr: np.ndarray, new: np.ndarray
+    data: np.ndarray, indptr: np.ndarray, new: np.ndarray, new_data: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray]:
-    """Append each value of new to each group in data formed by indptr."""
+    """Append each value of new to each group in data formed by indptr, writing the result to new_data."""
     n_series = len(indptr) - 1
-    new_data = np.empty(data.size + new.size, dtype=data.dtype)
     new_indptr = indptr.copy()
     new_indptr[1:] += np.arange(1, n_series + 1)
     for i in range(n_series):
@@ -186,9 +438,77 @@ class GroupedArray:
         return cls(data, indptr)
 
     def transform_series(
-        self, updates_only: bool, lag: int, func: Callable, *args
+        self,
+        updates_only: bool,
+        lag: int,
+        func: Callable,
+        *args,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Computes `func(shifted, *args)` over every group shifted by `lag`.
+
+        If `out` is provided the updates are written to it, which requires `updates_only=True`.
+        """
+        if out is None:
+            return _transform_series(
+                self.data, self.indptr, updates_only, lag, func, *args
+            )
+        if not updates_only:
+            raise ValueError("out can only be used with updates_only=True.")
+        if out.shape != (self.ngroups,):
+            raise ValueError(f"out must have shape ({self.ngroups},).")
+        _transform_series_updates(self.data, self.indptr, lag, out, func, *args)
+        return out
+
+    def transform_many(
+        self,
+        updates_only: bool,
+        offset: int,
+        lags: np.ndarray,
+        ops: np.ndarray,
+        args: np.ndarray,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
-        return _transform_series(self.data, self.indptr, updates_only, lag, func, *args)
+        """Computes the lag transformations packed by `_pack_transform` in a single numba call.
+
+        Returns an array with one row per transformation.
+        If `out` is provided the updates are written to it, which requires `updates_only=True`.
+        """
+        if not set(ops.tolist()) <= _transform_many_ops:
+            raise ValueError(f"ops must be in {sorted(_transform_many_ops)}.")
+        if out is None:
+            n_cols = self.ngroups if updates_only else self.data.size
+            out = np.empty((lags.size, n_cols), dtype=self.data.dtype)
+        elif not updates_only:
+            raise ValueError("out can only be used with updates_only=True.")
+        elif out.shape != (lags.size, self.ngroups):
+            raise ValueError(f"out must have shape ({lags.size}, {self.ngroups}).")
+        _transform_many(
+            self.data, self.indptr, updates_only, offset, lags, ops, args, out
+        )
+        return out
+
+    def transform_rolling_group(
+        self,
+        updates_only: bool,
+        lag: int,
+        window_size: int,
+        min_samples: int,
+        ops: np.ndarray,
+    ) -> np.ndarray:
+        """Computes several rolling statistics that share the same window in a single pass.
+
+        The values are assumed to be finite, with nulls only at the start of each group.
+        Returns an array with one row per element of `ops`."""
+        return _transform_rolling_group(
+            self.data, self.indptr, updates_only, lag, window_size, min_samples, ops
+        )
+
+    def transform_lags(self, updates_only: bool, lags: np.ndarray) -> np.ndarray:
+        """Shifts every group by each of `lags` in a single call.
+
+        Returns an array with one row per lag."""
+        return _transform_lags(self.data, self.indptr, updates_only, lags)
 
     def restore_difference(self, preds: np.ndarray, d: int) -> None:
         _restore_difference(preds, self.data, self.indptr, d)
@@ -220,11 +540,20 @@ class GroupedArray:
         indptr = np.append(0, sizes.cumsum())
         return GroupedArray(data, indptr)
 
-    def append(self, new: np.ndarray) -> "GroupedArray":
-        """Appends each element of `new` to each existing group. Returns a copy."""
+    def append(
+        self, new: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> "GroupedArray":
+        """Appends each element of `new` to each existing group. Returns a copy.
+
+        If `out` is provided the data of the result is written to its first elements."""
         if new.size != self.ngroups:
             raise ValueError(f"new must be of size {self.ngroups}")
-        new_data, new_indptr = _append_one(self.data, self.indptr, new)
+        size = self.data.size + new.size
+        if out is None:
+            out = np.empty(size, dtype=self.data.dtype)
+        elif out.size < size:
+            raise ValueError(f"out must have at least {size} elements.")
+        new_data, new_indptr = _append_one(self.data, self.indptr, new, out[:size])
         return GroupedArray(new_data, new_indptr)
 
     def append_several(